@@ -3,20 +3,39 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional
-import subprocess
-import json
+import asyncio
+import hashlib
+import socket
+import struct
+import sys
 import os
-import glob
+from collections import deque
+
+import orjson
+from cachetools import TTLCache
+
+from save_results import FRONTEND_KEYS, to_frontend
 
 app = FastAPI(title="JobHunt Scraper API")
 
 # ── CORS: lets your browser/frontend call this API ────────────────────────────
+# Explicit origins (comma-separated in CORS_ORIGINS) instead of "*": the UI
+# under /ui is same-origin and needs no CORS at all. Opening static/index.html
+# straight from disk sends "Origin: null", which is only allowed if "null" is
+# listed, e.g. CORS_ORIGINS="null,http://localhost:3000". Preflights are
+# cached by the browser for a day.
+CORS_ORIGINS = os.environ.get(
+    "CORS_ORIGINS",
+    "http://localhost:3000,http://localhost:8000,http://127.0.0.1:8000",
+).split(",")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],   # change to your frontend URL in production
+    allow_origins=[o.strip() for o in CORS_ORIGINS if o.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 # ── Serve frontend HTML if it exists in a /static folder ─────────────────────
@@ -24,6 +43,86 @@ if os.path.exists("static"):
     app.mount("/ui", StaticFiles(directory="static", html=True), name="static")
 
 
+# ── Scraper worker: one warm scraper_worker.py process shared by all requests ─
+WORKER_CMD = [sys.executable, "-u", "scraper_worker.py"]
+WORKER_TIMEOUT = 600   # 10 minutes max per scrape
+
+# Last chunks the worker wrote to stderr, reported back when it crashes
+_worker_log: deque = deque(maxlen=4)
+
+
+async def _drain_stderr(stream: asyncio.StreamReader):
+    """
+    Forward the worker's logs to our stderr, keeping the tail for error reports.
+    Reads fixed-size chunks rather than lines, so one overlong log line can't
+    stop the drain and leave the worker blocked on a full pipe.
+    """
+    while chunk := await stream.read(65536):
+        sys.stderr.buffer.write(chunk)
+        sys.stderr.flush()
+        _worker_log.append(chunk)
+
+
+async def _spawn_worker():
+    """
+    Start the worker with one end of a socketpair inherited as RESULT_FD.
+    Results come back over that socket as length-prefixed frames, so they
+    never share a channel with the worker's own stdout/stderr output.
+    """
+    results, child_end = socket.socketpair()
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *WORKER_CMD,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,   # results come back over the socket
+            stderr=asyncio.subprocess.PIPE,
+            pass_fds=(child_end.fileno(),),
+            env={**os.environ, "RESULT_FD": str(child_end.fileno())},
+        )
+    except Exception:
+        results.close()
+        raise
+    finally:
+        child_end.close()   # only the worker holds it now, so its exit reads as EOF
+    _worker_log.clear()
+    app.state.worker = proc
+    app.state.results, app.state.results_writer = await asyncio.open_connection(sock=results)
+    app.state.log_task = asyncio.create_task(_drain_stderr(proc.stderr))
+
+
+async def _ensure_worker():
+    """Watchdog: restart the worker if it has exited since the last request."""
+    if app.state.worker.returncode is not None:
+        app.state.results_writer.close()
+        await _spawn_worker()
+
+
+async def _ask_worker(runtime_config: dict) -> bytes:
+    worker, results = app.state.worker, app.state.results
+    worker.stdin.write(orjson.dumps(runtime_config) + b"\n")
+    await worker.stdin.drain()
+    header = await results.readexactly(4)
+    return await results.readexactly(struct.unpack(">I", header)[0])
+
+
+@app.on_event("startup")
+async def start_worker():
+    app.state.worker_lock = asyncio.Lock()
+    await _spawn_worker()
+
+
+@app.on_event("shutdown")
+async def stop_worker():
+    worker = app.state.worker
+    if worker.returncode is None:
+        worker.stdin.close()
+        try:
+            await asyncio.wait_for(worker.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            worker.kill()
+    app.state.results_writer.close()
+
+
 # ── Request model ─────────────────────────────────────────────────────────────
 class ScrapeRequest(BaseModel):
     keywords: List[str]                      # ["Amazon marketplace", "Ecommerce manager"]
@@ -33,6 +132,21 @@ class ScrapeRequest(BaseModel):
     strict_filter: bool = True
 
 
+# ── Result cache: identical requests within RESULT_CACHE_TTL reuse the last scrape
+RESULT_CACHE_TTL = 600   # seconds
+
+_result_cache: TTLCache = TTLCache(maxsize=64, ttl=RESULT_CACHE_TTL)
+_inflight: dict = {}   # cache key -> the asyncio.Task running that scrape
+
+
+async def _scrape_and_cache(key: bytes, runtime_config: dict) -> dict:
+    try:
+        _result_cache[key] = result = await _run_scrape(runtime_config)
+        return result
+    finally:
+        del _inflight[key]   # done either way; the next identical request starts afresh
+
+
 # ── Routes ────────────────────────────────────────────────────────────────────
 @app.get("/")
 def home():
@@ -40,80 +154,66 @@ def home():
 
 
 @app.post("/scrape")
-def scrape(req: ScrapeRequest):
+async def scrape(req: ScrapeRequest):
 
     if not req.keywords:
         raise HTTPException(status_code=400, detail="Add at least one keyword.")
 
-    # ── 1. Write runtime config so scraper.py can read it ─────────────────────
+    # ── 1. Build the runtime config that overrides config.py ────────────────
+    mkts = {m.lower() for m in req.marketplaces}
     runtime_config = {
         "keywords":            req.keywords,
         "location":            req.location,
         "results_per_keyword": req.results_per_keyword,
-        "require_amazon":      "amazon"      in [m.lower() for m in req.marketplaces],
-        "require_marketplace": "marketplace" in [m.lower() for m in req.marketplaces],
+        "require_amazon":      "amazon"      in mkts,
+        "require_marketplace": "marketplace" in mkts,
         "headless":            True,
     }
 
-    with open("runtime_config.json", "w") as f:
-        json.dump(runtime_config, f)
-
-    # ── 2. Clean up old results ────────────────────────────────────────────────
-    for old in glob.glob("indeed_jobs*.json"):
-        os.remove(old)
-
-    # ── 3. Run the scraper ─────────────────────────────────────────────────────
-    try:
-        result = subprocess.run(
-            ["python", "scraper.py"],
-            capture_output=True,
-            text=True,
-            timeout=600,       # 10 minutes max
-        )
-
-        if result.returncode != 0:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Scraper error: {result.stderr[-800:] if result.stderr else 'Unknown'}"
-            )
-
-    except subprocess.TimeoutExpired:
-        raise HTTPException(status_code=504, detail="Scraper timed out after 10 minutes.")
-
-    except FileNotFoundError:
-        raise HTTPException(status_code=500, detail="scraper.py not found. Run api.py from the same folder.")
-
-    finally:
-        # Always clean up the runtime config
-        if os.path.exists("runtime_config.json"):
-            os.remove("runtime_config.json")
-
-    # ── 4. Find the results file ───────────────────────────────────────────────
-    # save_to_json() in save_results.py creates a timestamped file like:
-    # indeed_jobs_2024-01-15_10-30-00.json  OR  indeed_jobs.json
-    result_files = sorted(glob.glob("indeed_jobs*.json"), key=os.path.getmtime, reverse=True)
-
-    if not result_files:
-        raise HTTPException(status_code=404, detail="Scraper ran but saved no results. Check your keywords or filters.")
-
-    with open(result_files[0]) as f:
-        raw = json.load(f)
-
-    # ── 5. Normalise to frontend format ───────────────────────────────────────
-    # Handles both: a raw list  OR  {"jobs": [...]}
-    raw_jobs = raw if isinstance(raw, list) else raw.get("jobs", [])
-
-    jobs = []
-    for j in raw_jobs:
-        jobs.append({
-            "title":       j.get("title", "Unknown Title"),
-            "company":     j.get("company", "Unknown Company"),
-            "location":    j.get("location", ""),
-            "salary":      j.get("salary", "N/A"),
-            "category":    j.get("category", "General"),
-            "date_posted": j.get("posted_date") or j.get("date_posted", ""),
-            "url":         j.get("url", "#"),
-        })
+    # ── 2. Serve repeats from the cache; identical in-flight scrapes share one run
+    key = hashlib.blake2b(orjson.dumps(runtime_config, option=orjson.OPT_SORT_KEYS)).digest()
+    cached = _result_cache.get(key)   # one lookup: the entry may expire between two
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = _inflight[key] = asyncio.create_task(_scrape_and_cache(key, runtime_config))
+    # shield: one caller disconnecting must not cancel the scrape the others await
+    return await asyncio.shield(task)
+
+
+async def _run_scrape(runtime_config: dict) -> dict:
+    # ── Hand the config to the worker (one scrape at a time) ──────────────────
+    async with app.state.worker_lock:
+        await _ensure_worker()
+        try:
+            line = await asyncio.wait_for(_ask_worker(runtime_config), timeout=WORKER_TIMEOUT)
+        except asyncio.TimeoutError:
+            app.state.worker.kill()   # the watchdog respawns it on the next request
+            await app.state.worker.wait()
+            raise HTTPException(status_code=504, detail="Scraper timed out after 10 minutes.")
+        except (asyncio.IncompleteReadError, ConnectionError):   # the worker died mid-request
+            line = b""
+
+    if not line:
+        tail = b"".join(_worker_log).decode(errors="replace")[-800:]
+        raise HTTPException(status_code=500, detail=f"Scraper worker crashed: {tail or 'Unknown'}")
+
+    raw = orjson.loads(line)
+    if "error" in raw:
+        raise HTTPException(status_code=500, detail=f"Scraper error: {raw['error'][-800:]}")
+
+    raw_jobs = raw.get("jobs", [])
+    if not raw_jobs:
+        raise HTTPException(status_code=404, detail="Scraper ran but found no results. Check your keywords or filters.")
+
+    # ── Normalise to frontend format ───────────────────────────────────────
+    # The worker already emits it, so this is normally a straight passthrough
+    if raw_jobs[0].keys() == FRONTEND_KEYS:
+        jobs = raw_jobs
+    else:
+        jobs = [to_frontend(j) for j in raw_jobs]
 
     return {
         "jobs":  jobs,
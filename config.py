@@ -2,17 +2,24 @@
 Configuration settings for the Indeed Job Scraper.
 """
 
-CONFIG = {
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperConfig:
     # -------------------------------------------------------------------------
     # Search Settings
     # -------------------------------------------------------------------------
 
+    # Broad search queries to run. Empty = use broad_searches from keywords.json
+    keywords: tuple[str, ...] = ()
+
     # Location to search for jobs (e.g., "Remote", "New York, NY", "USA")
     # Leave empty "" to search everywhere
-    'location': '',
+    location: str = ''
 
     # Number of job CARDS to collect per broad search query (before filtering)
-    'results_per_keyword': 50,
+    results_per_keyword: int = 50
 
     # -------------------------------------------------------------------------
     # Filtering Logic
@@ -20,45 +27,63 @@ CONFIG = {
 
     # Must the word "amazon" appear in title OR description to keep the job?
     # Set True to enforce the Amazon relevance requirement.
-    'require_amazon': True,
+    require_amazon: bool = True
 
     # Must the job also have at least one marketplace-related term?
     # Set True to enforce marketplace relevance requirement.
-    'require_marketplace': True,
+    require_marketplace: bool = True
+
+    # Reject a job from its card alone (no detail page fetch) when require_amazon
+    # is on and neither the title nor the snippet mentions Amazon?
+    # Much faster, but misses jobs that only mention Amazon deeper in the description.
+    snippet_prefilter: bool = False
 
     # -------------------------------------------------------------------------
     # Delays (seconds) — human-like behavior to avoid blocks
     # -------------------------------------------------------------------------
 
     # Random delay range between keyword searches: [min, max] seconds
-    'delay_between_requests': [2, 5],
+    delay_between_requests: tuple[float, float] = (2, 5)
 
     # Random delay range between pagination clicks: [min, max] seconds
-    'delay_between_pages': [1.5, 3.5],
+    delay_between_pages: tuple[float, float] = (1.5, 3.5)
 
     # Random delay range when opening a job detail page: [min, max] seconds
-    'delay_open_job': [1.0, 2.5],
+    delay_open_job: tuple[float, float] = (1.0, 2.5)
+
+    # Max job detail pages fetched at once over plain HTTP
+    detail_concurrency: int = 8
 
     # -------------------------------------------------------------------------
     # Browser Settings
     # -------------------------------------------------------------------------
 
     # Run Chrome in headless mode? True = invisible, False = visible window
-    'headless': True,
+    headless: bool = True
+
+    # Skip images, stylesheets, fonts and trackers when loading pages?
+    # Much less to download per page; turn off if pages stop rendering cards.
+    block_resources: bool = True
+
+    # Number of search queries scraped in parallel, each in its own Chrome
+    parallel_queries: int = 4
 
     # Maximum number of retries per page load on timeout/error
-    'max_retries': 3,
+    max_retries: int = 3
 
     # Timeout for page loading (seconds)
-    'timeout': 30,
+    timeout: int = 30
 
     # -------------------------------------------------------------------------
     # Output Settings
     # -------------------------------------------------------------------------
 
     # Prefix for output filenames
-    'output_file_prefix': 'indeed_jobs',
+    output_file_prefix: str = 'indeed_jobs'
+
+    # Save full job description text in CSV/JSON Lines?
+    save_full_description: bool = True
+
 
-    # Save full job description text in CSV/JSON?
-    'save_full_description': True,
-}
+# Defaults — per-run overrides use dataclasses.replace(CONFIG, ...)
+CONFIG = ScraperConfig()
@@ -1,60 +1,61 @@
 """
-Save scraped job results to CSV and JSON files.
+Save scraped job results to CSV and NDJSON files, and shape them for the API.
 """
 
-import json
-import pandas as pd
-from datetime import datetime
-from config import CONFIG
-
- 
-def _timestamp() -> str:
-    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-
-def save_to_csv(jobs, filename=None):
-    """Save jobs list to a CSV file. Returns the filename used."""
-    if not jobs:
-        print("No jobs to save.")
-        return None
-
-    if filename is None:
-        filename = f"{CONFIG['output_file_prefix']}_{_timestamp()}.csv"
-
-    df = pd.DataFrame(jobs)
-
-    # Preferred column order
-    preferred = ['category', 'keyword', 'search_query', 'title', 'company',
-                 'location', 'salary', 'posted_date', 'url', 'description']
-    cols = [c for c in preferred if c in df.columns] + \
-           [c for c in df.columns if c not in preferred]
-    df = df[cols]
-
-    try:
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"✅ Saved {len(jobs)} jobs → {filename}")
-    except Exception as e:
-        print(f"❌ Error saving CSV: {e}")
-
-    return filename
-
-
-def save_to_json(jobs, filename=None):
-    """Save jobs list to a JSON file. Returns the filename used."""
-    if not jobs:
-        return None
-
-    if filename is None:
-        filename = f"{CONFIG['output_file_prefix']}_{_timestamp()}.json"
-
-    try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, indent=2, ensure_ascii=False)
-        print(f"✅ Saved {len(jobs)} jobs → {filename}")
-    except Exception as e:
-        print(f"❌ Error saving JSON: {e}")
-
-    return filename
+import csv
+import orjson
+from collections import Counter
+
+
+# Preferred CSV column order
+CSV_COLUMNS = ['category', 'keyword', 'search_query', 'title', 'company',
+               'location', 'salary', 'posted_date', 'url', 'description']
+
+
+class JobFileWriter:
+    """
+    Append jobs to a CSV file (and optionally an NDJSON .jsonl file, one job
+    per line) as they are scraped, so a crash mid-run keeps everything
+    written so far. Columns are fixed to CSV_COLUMNS. The files are only
+    created by the first non-empty write.
+    """
+
+    def __init__(self, csv_filename, jsonl_filename=None):
+        self.csv_filename = csv_filename
+        self.jsonl_filename = jsonl_filename
+        self.count = 0
+        self._csv_file = self._csv_writer = self._jsonl_file = None
+
+    def write(self, jobs):
+        """Append *jobs* to the files and flush them."""
+        if not jobs:
+            return
+        try:
+            if self._csv_writer is None:
+                self._csv_file = open(self.csv_filename, 'w', newline='', encoding='utf-8-sig')
+                self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_COLUMNS, extrasaction='ignore')
+                self._csv_writer.writeheader()
+                if self.jsonl_filename:
+                    self._jsonl_file = open(self.jsonl_filename, 'wb')
+
+            self._csv_writer.writerows(jobs)
+            self._csv_file.flush()
+            if self._jsonl_file:
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+                self._jsonl_file.write(b"".join(orjson.dumps(job, option=option) for job in jobs))
+                self._jsonl_file.flush()
+            self.count += len(jobs)
+        except Exception as e:
+            print(f"❌ Error saving jobs: {e}")
+
+    def close(self):
+        """Close the files and report what was written."""
+        for f in (self._csv_file, self._jsonl_file):
+            if f is not None:
+                f.close()
+        if self.count:
+            names = " + ".join(n for n in (self.csv_filename, self._jsonl_file and self.jsonl_filename) if n)
+            print(f"✅ Saved {self.count} jobs → {names}")
 
 
 def generate_summary(jobs):
@@ -62,28 +63,60 @@ def generate_summary(jobs):
     if not jobs:
         return
 
-    df = pd.DataFrame(jobs)
+    # One pass over the jobs for every count (None = field missing, skipped)
+    by_category, by_query, by_location = Counter(), Counter(), Counter()
+    with_salary = 0
+    for job in jobs:
+        by_category[job.get('category')] += 1
+        by_query[job.get('search_query')] += 1
+        by_location[job.get('location')] += 1
+        if job.get('salary') not in (None, 'N/A'):
+            with_salary += 1
+    for counts in (by_category, by_query, by_location):
+        counts.pop(None, None)
 
     print("\n" + "="*60)
     print("📊 SCRAPING SUMMARY")
     print("="*60)
-    print(f"Total Jobs Kept: {len(df)}")
+    print(f"Total Jobs Kept: {len(jobs)}")
 
-    if 'category' in df.columns:
+    if by_category:
         print("\n📂 Jobs by Category:")
-        for cat, cnt in df['category'].value_counts().items():
+        for cat, cnt in by_category.most_common():
             print(f"   {cat}: {cnt}")
 
-    if 'search_query' in df.columns:
+    if by_query:
         print("\n🔍 Jobs by Search Query:")
-        for q, cnt in df['search_query'].value_counts().items():
+        for q, cnt in by_query.most_common():
             print(f"   {q}: {cnt}")
 
-    if 'location' in df.columns:
+    if by_location:
         print("\n📍 Top 10 Locations:")
-        for loc, cnt in df['location'].value_counts().head(10).items():
+        for loc, cnt in by_location.most_common(10):
             print(f"   {loc}: {cnt}")
 
-    jobs_with_salary = df[df['salary'].notna() & (df['salary'] != 'N/A')]
-    print(f"\n💰 Jobs with Salary Info: {len(jobs_with_salary)} / {len(df)}")
+    print(f"\n💰 Jobs with Salary Info: {with_salary} / {len(jobs)}")
     print("="*60 + "\n")
+
+
+# ---------------------------------------------------------------------------
+# API / frontend job format: (frontend key, scraper key, default)
+# ---------------------------------------------------------------------------
+FRONTEND_KEY_MAP = (
+    ("title",       "title",       "Unknown Title"),
+    ("company",     "company",     "Unknown Company"),
+    ("location",    "location",    ""),
+    ("salary",      "salary",      "N/A"),
+    ("category",    "category",    "General"),
+    ("date_posted", "date_posted", ""),
+    ("url",         "url",         "#"),
+)
+FRONTEND_KEYS = frozenset(out for out, _, _ in FRONTEND_KEY_MAP)
+
+
+def to_frontend(job: dict, _get=dict.get) -> dict:
+    """Reduce a scraped job to the fields the frontend displays."""
+    out = {key: _get(job, src, default) for key, src, default in FRONTEND_KEY_MAP}
+    # scraper.py emits posted_date; other producers may already use date_posted
+    out["date_posted"] = _get(job, "posted_date") or out["date_posted"]
+    return out
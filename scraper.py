@@ -13,12 +13,19 @@ Strategy:
      Keywords are used for categorisation only, NOT for filtering.
 """
 
+import asyncio
+import functools
+import itertools
+import os
+import queue
+import threading
 import time
 import random
 import json
 import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from urllib.parse import urlencode
 
 from selenium import webdriver
@@ -27,28 +34,24 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import NoSuchWindowException, TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import aiohttp
+import lxml.html
+from lxml.cssselect import CSSSelector
 
-from config import CONFIG
-import os as _os, json as _json
-
-_runtime = {}
-if _os.path.exists("runtime_config.json"):
-    with open("runtime_config.json") as _f:
-        _runtime = _json.load(_f)
+try:
+    import ahocorasick
+except ImportError:   # pyahocorasick not installed — fall back to one regex scan
+    ahocorasick = None
 
-# Override CONFIG values if api.py passed a runtime config
-if _runtime:
-    CONFIG['location']             = _runtime.get('location',             CONFIG['location'])
-    CONFIG['results_per_keyword']  = _runtime.get('results_per_keyword',  CONFIG['results_per_keyword'])
-    CONFIG['require_amazon']       = _runtime.get('require_amazon',       CONFIG['require_amazon'])
-    CONFIG['require_marketplace']  = _runtime.get('require_marketplace',  CONFIG['require_marketplace'])
-    CONFIG['headless']             = _runtime.get('headless',             CONFIG['headless'])
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:   # selectolax not installed — fall back to lxml
+    LexborHTMLParser = None
 
-# ── END OF PATCH ─────
-from save_results import save_to_csv, save_to_json, generate_summary
+from config import CONFIG
+from save_results import JobFileWriter, generate_summary
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -61,20 +64,261 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Sent by Chrome and by the plain-HTTP description fetches alike
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+
+
+# Never downloaded when block_resources is on — the scraper only reads the DOM
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*doubleclick*", "*google-analytics*", "*googletagmanager*",
+]
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary once per process. CHROMEDRIVER_PATH wins
+    if it points at an existing file; otherwise webdriver-manager installs
+    (or reuses its cached) driver.
+    """
+    path = os.environ.get('CHROMEDRIVER_PATH', '')
+    if path and os.path.exists(path):
+        return path
+    return ChromeDriverManager().install()
+
+
 def rand_delay(range_cfg):
     """Sleep for a random duration within the configured [min, max] range."""
     lo, hi = range_cfg
     time.sleep(random.uniform(lo, hi))
 
 
-def contains_any(text: str, terms: list) -> bool:
-    """Return True if any term from *terms* appears in *text* (case-insensitive)."""
-    text_lower = text.lower()
-    return any(t.lower() in text_lower for t in terms)
+def compile_terms(terms: list, overlapping: bool = False) -> re.Pattern:
+    """
+    Compile already-lowercased *terms* into one pattern that matches any
+    of them as a plain substring (longest first) in lowercased text. With
+    *overlapping*, findall() also reports terms that start inside an
+    earlier match.
+    """
+    if not terms:
+        return re.compile(r'(?!)')   # matches nothing, like any() over no terms
+    alternation = '|'.join(map(re.escape, sorted(set(terms), key=len, reverse=True)))
+    if overlapping:
+        alternation = f'(?=({alternation}))'
+    return re.compile(alternation)
+
+
+_JK_RE = re.compile(r'jk=([a-f0-9]+)')
+_HEX_DIGITS = frozenset('0123456789abcdef')
+
+
+def _extract_jk(href: str) -> str | None:
+    """Return the job key (jk=...) from a job link, or None."""
+    # Fast path: the first jk= value runs up to the next '&' and is all hex
+    _, sep, tail = href.partition('jk=')
+    if not sep:
+        return None
+    jk = tail.split('&', 1)[0]
+    if jk and _HEX_DIGITS.issuperset(jk):
+        return jk
+    jk_match = _JK_RE.search(href)
+    return jk_match.group(1) if jk_match else None
+
+
+@dataclass(frozen=True, slots=True)
+class JobTextIndex:
+    """Keyword terms found in one job's title and description (see IndeedScraper._index_job)."""
+    title_hits: frozenset   # terms inside the title
+    hits: frozenset         # terms anywhere in title + description
+
+
+# Job card fields: (default, CSS selectors tried in priority order)
+CARD_FIELDS = {
+    'title':       ("",    'h2.jobTitle'),
+    'company':     ("N/A", 'span[data-testid="company-name"]', 'span.companyName'),
+    'location':    ("N/A", 'div[data-testid="text-location"]', 'div.companyLocation'),
+    'salary':      ("N/A", 'div.salary-snippet-container', 'div[data-testid="attribute_snippet_testid"]'),
+    'snippet':     ("",    'div.job-snippet'),
+    'posted_date': ("N/A", 'span.date'),
+}
+
+
+def _lexbor_card_fields(card) -> dict:
+    """Raw field values from a selectolax (Lexbor) job card node."""
+    fields = {}
+    for name, (default, *selectors) in CARD_FIELDS.items():
+        el = next((el for sel in selectors if (el := card.css_first(sel)) is not None), None)
+        fields[name] = el.text(strip=True) if el is not None else default
+
+    link_el = card.css_first('a[href]')
+    fields['href'] = (link_el.attributes.get('href') or "") if link_el is not None else ""
+    return fields
+
+
+# CARD_FIELDS selectors compiled to XPath once, for the lxml fallback
+_LXML_CARD_FIELDS = {
+    name: (default, [CSSSelector(sel) for sel in selectors])
+    for name, (default, *selectors) in CARD_FIELDS.items()
+}
+_LXML_LINK = CSSSelector('a[href]')
+
+
+def _lxml_text(el) -> str:
+    """Text of an lxml element with each text node stripped, like selectolax's text(strip=True)."""
+    return "".join(s.strip() for s in el.itertext())
+
+
+def _lxml_card_fields(card) -> dict:
+    """Raw field values from an lxml job card element."""
+    fields = {}
+    for name, (default, selectors) in _LXML_CARD_FIELDS.items():
+        el = next((found[0] for sel in selectors if (found := sel(card))), None)
+        fields[name] = _lxml_text(el) if el is not None else default
+
+    links = _LXML_LINK(card)
+    fields['href'] = links[0].get('href') if links else ""
+    return fields
+
+
+def _html_text(fragment: str) -> str:
+    """Plain text of an HTML fragment."""
+    if not fragment:
+        return ""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(fragment).text(strip=True)
+    return _lxml_text(lxml.html.fragment_fromstring(fragment, create_parent='div'))
+
+
+def _mosaic_card_fields(result: dict) -> dict:
+    """Raw field values from one result of Indeed's embedded job card data."""
+    jk = result.get('jobkey') or ""
+    return {
+        'title': result.get('title') or "",
+        'company': result.get('company') or "N/A",
+        'location': result.get('formattedLocation') or "N/A",
+        'salary': (result.get('salarySnippet') or {}).get('text') or "N/A",
+        'snippet': _html_text(result.get('snippet') or ""),
+        'posted_date': result.get('formattedRelativeTime') or "N/A",
+        'href': f"/viewjob?jk={jk}" if jk else "",
+    }
+
+
+# Elements that start a new line in the rendered description
+BLOCK_TAGS = ('p', 'div', 'br', 'li', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+              'tr', 'table', 'section', 'blockquote', 'pre')
+BLOCK_SELECTOR = ', '.join(BLOCK_TAGS)
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace runs inside each line and drop blank lines."""
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _extract_description(html: str) -> str | None:
+    """
+    Return the text of #jobDescriptionText, or None if the page lacks it
+    (e.g. a challenge page). Inline markup stays on one line and block
+    elements start new ones, like Selenium's rendered element text.
+    """
+    if LexborHTMLParser is not None:
+        el = LexborHTMLParser(html).css_first('#jobDescriptionText')
+        if el is None:
+            return None
+        for block in el.css(BLOCK_SELECTOR):
+            block.insert_before("\n")
+            block.insert_after("\n")
+        return _normalize_text(el.text(deep=True, separator="", strip=False))
+
+    if not html.strip():
+        return None
+    el = lxml.html.document_fromstring(html).get_element_by_id('jobDescriptionText', None)
+    if el is None:
+        return None
+    for block in el.iter(*BLOCK_TAGS):
+        block.text = "\n" + (block.text or "")
+        block.tail = "\n" + (block.tail or "")
+    return _normalize_text(el.text_content())
+
+
+_LXML_CARDS = CSSSelector('div.job_seen_beacon')
+_LXML_TD_CARDS = CSSSelector('td.resultContent')
+
+
+def _find_cards(html: str) -> list:
+    """Parse a search results page and return its job card nodes."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        # Try multiple selectors for resilience
+        return tree.css('div.job_seen_beacon') or tree.css('td.resultContent')
+
+    if not html.strip():
+        return []
+    tree = lxml.html.document_fromstring(html)
+    return _LXML_CARDS(tree) or _LXML_TD_CARDS(tree)
+
+
+# The search page embeds its job cards as JSON for Indeed's own front end;
+# reading that skips serialising and re-parsing the rendered DOM
+MOSAIC_RESULTS_JS = (
+    "return window.mosaic?.providerData?.['mosaic-provider-jobcards']"
+    "?.metaData?.mosaicProviderJobCardsModel?.results ?? null;"
+)
+
+
+# Just the job card markup, in one round trip instead of the whole page_source.
+# td cards are re-wrapped in a table so the HTML parser keeps them.
+CARDS_HTML_JS = """
+let cards = document.querySelectorAll('div.job_seen_beacon');
+if (cards.length) return Array.from(cards, el => el.outerHTML).join('');
+cards = document.querySelectorAll('td.resultContent');
+return '<table>' + Array.from(cards, el => '<tr>' + el.outerHTML + '</tr>').join('') + '</table>';
+"""
+
+
+def _parse_cards(card_fields, cards) -> list:
+    """Apply *card_fields* to each card, skipping (and logging) any that fail."""
+    fields = []
+    for card in cards:
+        try:
+            fields.append(card_fields(card))
+        except Exception as e:
+            logger.debug(f"Card parse error: {e}")
+    return fields
+
+
+def _page_card_fields(driver) -> list:
+    """
+    Raw field dicts for every job card on the loaded search results page.
+    Uses the embedded job card data when present and falls back to parsing
+    the job cards' HTML when it is missing (e.g. after a layout change).
+    """
+    try:
+        results = driver.execute_script(MOSAIC_RESULTS_JS)
+    except WebDriverException as e:
+        logger.debug(f"  Embedded job card data unavailable: {e}")
+        results = None
+    if results:
+        return _parse_cards(_mosaic_card_fields, results)
+
+    try:
+        html = driver.execute_script(CARDS_HTML_JS)
+    except WebDriverException as e:
+        logger.debug(f"  Could not read job card markup, parsing the whole page: {e}")
+        html = driver.page_source
+
+    card_fields = _lexbor_card_fields if LexborHTMLParser is not None else _lxml_card_fields
+    return _parse_cards(card_fields, _find_cards(html))
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +336,15 @@ BLACKLISTED_COMPANIES = [
     "deloitte", "accenture", "pwc", "kpmg", "ernst & young",
     "capgemini", "infosys", "tcs", "wipro", "cognizant",
 ]
+BLACKLIST_RE = compile_terms([c.lower() for c in BLACKLISTED_COMPANIES])
+
+# Category priority order used by _categorize
+CATEGORY_PRIORITY = [
+    "Amazon-Specific",
+    "Leadership Roles",
+    "Marketplace General",
+    "Related Roles",
+]
 
 
 # ---------------------------------------------------------------------------
@@ -100,12 +353,17 @@ BLACKLISTED_COMPANIES = [
 
 class IndeedScraper:
 
-    def __init__(self):
-        self.driver = None
+    def __init__(self, config: dict | None = None):
+        # Per-run overrides (e.g. from api.py) layered over the defaults in config.py
+        self.config = replace(CONFIG, **(config or {}))
+        self.drivers = []        # one Chrome per parallel query worker
+        self._detail_tabs = {}   # driver -> (search results handle, job detail handle)
         self.jobs = []           # accepted jobs
         self.rejected = []       # jobs that failed the relevance filter
         self.seen_urls: set = set()
+        self._lock = threading.Lock()   # guards seen_urls and drivers across workers
         self.kw_data = self._load_keywords()
+        self._compile_keywords()
 
     # ------------------------------------------------------------------
     # Setup
@@ -126,37 +384,124 @@ class IndeedScraper:
                 "category_rules": {}
             }
 
+    def _compile_keywords(self):
+        """
+        Lowercase every keywords.json term list once and build a single
+        multi-pattern matcher over all of them (Aho-Corasick, or one regex
+        when pyahocorasick is not installed). kw_data itself keeps the
+        original spelling for the 'keyword' report column.
+        """
+        def lower(terms):
+            return [t.lower() for t in terms]
+
+        filters = self.kw_data.get('relevance_filters', {})
+        self._amazon_terms_lc = lower(filters.get('amazon_terms', ['amazon']))
+        self._mkt_terms_lc = lower(filters.get('marketplace_terms', []))
+
+        rules = self.kw_data.get('category_rules', {})
+        self._cat_title_lc = {cat: lower(rules.get(cat, {}).get('title_keywords', [])) for cat in CATEGORY_PRIORITY}
+        self._cat_desc_lc = {cat: lower(rules.get(cat, {}).get('description_keywords', [])) for cat in CATEGORY_PRIORITY}
+
+        # Unique (original, lowercased) pairs, in report order
+        self._all_kws = list(dict.fromkeys(
+            (kw, kw.lower())
+            for cat_rule in rules.values()
+            for kind in ('title_keywords', 'description_keywords')
+            for kw in cat_rule.get(kind, [])
+        ))
+
+        # Every term any check looks for — scanned for all at once per job
+        terms = {*self._amazon_terms_lc, *self._mkt_terms_lc,
+                 *(t for kws in self._cat_title_lc.values() for t in kws),
+                 *(t for kws in self._cat_desc_lc.values() for t in kws),
+                 *(kw_lower for _, kw_lower in self._all_kws)}
+        terms.discard("")
+
+        self._ac = None
+        if ahocorasick is not None and terms:
+            self._ac = ahocorasick.Automaton()
+            for term in terms:
+                self._ac.add_word(term, term)
+            self._ac.make_automaton()
+        else:
+            self._terms_re = compile_terms(terms, overlapping=True)
+            # finditer() reports the longest term at each position, so map it
+            # back to every term that is a prefix of it (all of them matched)
+            self._term_prefixes = {t: [p for p in terms if t.startswith(p)] for t in terms}
+
+    def _index_job(self, title: str, description: str) -> JobTextIndex:
+        """
+        Find every keyword term in the job's lowercased "title description"
+        text in one pass; the relevance, category and keyword checks all
+        read the result.
+        """
+        title_lower = title.lower()
+        combined_lower = title_lower + " " + description.lower()
+        title_end = len(title_lower)
+        title_hits, hits = set(), set()
+
+        if self._ac is not None:
+            for end, term in self._ac.iter(combined_lower):   # end = index of last char
+                hits.add(term)
+                if end < title_end:
+                    title_hits.add(term)
+        else:
+            for m in self._terms_re.finditer(combined_lower):
+                for term in self._term_prefixes[m.group(1)]:
+                    hits.add(term)
+                    if m.start() + len(term) <= title_end:
+                        title_hits.add(term)
+
+        return JobTextIndex(frozenset(title_hits), frozenset(hits))
+
     def _setup_driver(self):
+        """Start a new Chrome session and return it."""
         logger.info("Setting up Chrome WebDriver …")
         opts = Options()
-        if CONFIG['headless']:
+        if self.config.headless:
             opts.add_argument("--headless=new")
 
         opts.add_argument("--disable-blink-features=AutomationControlled")
         opts.add_argument("--window-size=1920,1080")
         opts.add_argument("--no-sandbox")
         opts.add_argument("--disable-dev-shm-usage")
-        opts.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/122.0.0.0 Safari/537.36"
-        )
+        opts.add_argument(f"user-agent={USER_AGENT}")
         opts.add_experimental_option("excludeSwitches", ["enable-automation"])
         opts.add_experimental_option("useAutomationExtension", False)
 
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=opts)
-        self.driver.execute_script(
+        # Return from driver.get() at DOMContentLoaded; we wait for the
+        # elements we need explicitly anyway
+        opts.page_load_strategy = 'eager'
+        if self.config.block_resources:
+            opts.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+
+        service = Service(chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=opts)
+        with self._lock:
+            self.drivers.append(driver)
+        driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
+        self._block_resources(driver)
         logger.info("WebDriver ready.")
+        return driver
+
+    def _block_resources(self, driver):
+        """Block BLOCKED_URL_PATTERNS in *driver*'s current tab (CDP settings are per tab)."""
+        if self.config.block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
 
     # ------------------------------------------------------------------
     # URL builder
     # ------------------------------------------------------------------
 
     def _build_url(self, query: str, start: int = 0) -> str:
-        params = {'q': query, 'l': CONFIG['location'], 'sort': 'date'}
+        params = {'q': query, 'l': self.config.location, 'sort': 'date'}
         if start > 0:
             params['start'] = start
         return "https://www.indeed.com/jobs?" + urlencode(params)
@@ -165,26 +510,26 @@ class IndeedScraper:
     # Page loading with retry
     # ------------------------------------------------------------------
 
-    def _load_page(self, url: str, wait_selector: str = None) -> bool:
+    def _load_page(self, driver, url: str, wait_selector: str = None) -> bool:
         """
         Navigate to *url* with retry logic.
         Returns True on success, False after all retries exhausted.
         """
-        for attempt in range(1, CONFIG['max_retries'] + 1):
+        for attempt in range(1, self.config.max_retries + 1):
             try:
-                self.driver.get(url)
+                driver.get(url)
                 if wait_selector:
-                    WebDriverWait(self.driver, CONFIG['timeout']).until(
+                    WebDriverWait(driver, self.config.timeout).until(
                         EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
                     )
                 return True
             except TimeoutException:
-                logger.warning(f"Timeout on attempt {attempt}/{CONFIG['max_retries']} for {url}")
-                if attempt < CONFIG['max_retries']:
+                logger.warning(f"Timeout on attempt {attempt}/{self.config.max_retries} for {url}")
+                if attempt < self.config.max_retries:
                     time.sleep(3 * attempt)
             except WebDriverException as e:
                 logger.warning(f"WebDriver error on attempt {attempt}: {e}")
-                if attempt < CONFIG['max_retries']:
+                if attempt < self.config.max_retries:
                     time.sleep(3 * attempt)
         logger.error(f"All retries failed for {url}")
         return False
@@ -193,8 +538,9 @@ class IndeedScraper:
     # Relevance filter
     # ------------------------------------------------------------------
 
-    def _is_relevant(self, title: str, description: str, company: str = "") -> bool:
+    def _is_relevant(self, index: JobTextIndex, company: str = "") -> bool:
         """
+        Check the terms found in the job's title + description (see _index_job).
         Return True if the job passes ALL relevance requirements:
           - Company is NOT in the blacklist
           - (optional) "amazon" in title or description
@@ -202,24 +548,17 @@ class IndeedScraper:
         """
 
         # ── 1. Company blacklist check ─────────────────────────────────────
-        company_lower = company.lower().strip()
-        if any(blocked in company_lower for blocked in BLACKLISTED_COMPANIES):
+        if BLACKLIST_RE.search(company.lower()):
             logger.debug(f"  BLACKLISTED COMPANY: {company}")
             return False
 
         # ── 2. Amazon relevance check ──────────────────────────────────────
-        combined = (title + " " + description).lower()
-
-        if CONFIG.get('require_amazon', True):
-            amazon_terms = self.kw_data.get('relevance_filters', {}).get('amazon_terms', ['amazon'])
-            if not contains_any(combined, amazon_terms):
-                return False
+        if self.config.require_amazon and index.hits.isdisjoint(self._amazon_terms_lc):
+            return False
 
         # ── 3. Marketplace relevance check ─────────────────────────────────
-        if CONFIG.get('require_marketplace', True):
-            mkt_terms = self.kw_data.get('relevance_filters', {}).get('marketplace_terms', [])
-            if mkt_terms and not contains_any(combined, mkt_terms):
-                return False
+        if self.config.require_marketplace and self._mkt_terms_lc and index.hits.isdisjoint(self._mkt_terms_lc):
+            return False
 
         return True
 
@@ -227,29 +566,15 @@ class IndeedScraper:
     # Categorisation (runs AFTER the job is accepted)
     # ------------------------------------------------------------------
 
-    def _categorize(self, title: str, description: str) -> str:
+    def _categorize(self, index: JobTextIndex) -> str:
         """
-        Assign a category by checking title and description against
-        the rules defined in keywords.json → category_rules.
-        Falls back to 'Uncategorized' if nothing matches.
+        Assign a category by checking the terms found in the title and in
+        title + description against the rules defined in keywords.json →
+        category_rules. Falls back to 'Uncategorized' if nothing matches.
         """
-        combined = (title + " " + description).lower()
-        rules = self.kw_data.get('category_rules', {})
-
-        # Priority order
-        priority = [
-            "Amazon-Specific",
-            "Leadership Roles",
-            "Marketplace General",
-            "Related Roles",
-        ]
-
-        for cat in priority:
-            rule = rules.get(cat, {})
-            title_kws = rule.get('title_keywords', [])
-            desc_kws  = rule.get('description_keywords', [])
-
-            if contains_any(title.lower(), title_kws) or contains_any(combined, desc_kws):
+        for cat in CATEGORY_PRIORITY:
+            if (not index.title_hits.isdisjoint(self._cat_title_lc[cat])
+                    or not index.hits.isdisjoint(self._cat_desc_lc[cat])):
                 return cat
 
         return "Uncategorized"
@@ -258,131 +583,185 @@ class IndeedScraper:
     # Assign matched keywords (for reporting)
     # ------------------------------------------------------------------
 
-    def _matched_keywords(self, title: str, description: str) -> str:
+    def _matched_keywords(self, index: JobTextIndex) -> str:
         """
-        Return a comma-separated list of original user keywords that appear
-        in the job title or description (used for the 'keyword' column).
+        Return a comma-separated list of original user keywords found in
+        the job title or description (used for the 'keyword' column).
         """
-        all_kws = []
-        rules = self.kw_data.get('category_rules', {})
-        for cat_rule in rules.values():
-            all_kws.extend(cat_rule.get('title_keywords', []))
-            all_kws.extend(cat_rule.get('description_keywords', []))
-
-        combined = (title + " " + description).lower()
-        matched = [kw for kw in all_kws if kw.lower() in combined]
-        # deduplicate while preserving order
-        seen = set()
-        unique = []
-        for k in matched:
-            if k not in seen:
-                seen.add(k)
-                unique.append(k)
-        return ", ".join(unique[:5]) if unique else "broad search"
+        # _all_kws is already deduplicated, so stop at the fifth match
+        matched = list(itertools.islice(
+            (kw for kw, kw_lower in self._all_kws if kw_lower in index.hits), 5))
+        return ", ".join(matched) if matched else "broad search"
 
     # ------------------------------------------------------------------
     # Parse a single job card (from search results page)
     # ------------------------------------------------------------------
 
-    def _parse_card(self, card_soup) -> dict | None:
-        """Extract basic fields from a BeautifulSoup job card element."""
+    def _parse_card(self, fields: dict) -> dict | None:
+        """Build a job dict from a card's raw fields (see _page_card_fields)."""
         try:
-            # Title
-            title_el = card_soup.find('h2', class_='jobTitle')
-            title = title_el.get_text(strip=True) if title_el else ""
-
             # URL / job key
-            link_el = card_soup.find('a', href=True)
-            href = link_el['href'] if link_el else ""
+            href = fields['href']
             if href and not href.startswith('http'):
                 href = "https://www.indeed.com" + href
             # extract jk param for canonical URL
-            jk_match = re.search(r'jk=([a-f0-9]+)', href)
-            url = f"https://www.indeed.com/viewjob?jk={jk_match.group(1)}" if jk_match else href
+            jk = _extract_jk(href)
+            url = f"https://www.indeed.com/viewjob?jk={jk}" if jk else href
 
-            if not url or url in self.seen_urls:
-                return None
-            self.seen_urls.add(url)
-
-            # Company
-            co_el = (card_soup.find('span', {'data-testid': 'company-name'})
-                     or card_soup.find('span', class_='companyName'))
-            company = co_el.get_text(strip=True) if co_el else "N/A"
-
-            # Location
-            loc_el = (card_soup.find('div', {'data-testid': 'text-location'})
-                      or card_soup.find('div', class_='companyLocation'))
-            location = loc_el.get_text(strip=True) if loc_el else "N/A"
-
-            # Salary
-            sal_el = (card_soup.find('div', class_='salary-snippet-container')
-                      or card_soup.find('div', {'data-testid': 'attribute_snippet_testid'}))
-            salary = sal_el.get_text(strip=True) if sal_el else "N/A"
-
-            # Snippet description (short)
-            snip_el = card_soup.find('div', class_='job-snippet')
-            snippet = snip_el.get_text(strip=True) if snip_el else ""
-
-            # Posted date
-            date_el = card_soup.find('span', class_='date')
-            posted_date = date_el.get_text(strip=True).replace("Posted", "").strip() if date_el else "N/A"
+            with self._lock:
+                if not url or url in self.seen_urls:
+                    return None
+                self.seen_urls.add(url)
 
             return {
-                'title': title,
-                'company': company,
-                'location': location,
-                'salary': salary,
+                'title': fields['title'],
+                'company': fields['company'],
+                'location': fields['location'],
+                'salary': fields['salary'],
                 'url': url,
-                'description': snippet,   # will be replaced with full desc below
-                'posted_date': posted_date,
+                'description': fields['snippet'],   # will be replaced with full desc below
+                'posted_date': fields['posted_date'].replace("Posted", "").strip(),
             }
         except Exception as e:
             logger.debug(f"Card parse error: {e}")
             return None
 
+    # ------------------------------------------------------------------
+    # Fetch full job descriptions over plain HTTP (concurrently)
+    # ------------------------------------------------------------------
+
+    def _fetch_descriptions(self, driver, urls: list) -> list:
+        """
+        Fetch the full descriptions for *urls*, in order, concurrently over
+        HTTP with the browser's cookies. None marks a failure or challenge
+        page; see _fill_description for the browser fallback.
+        """
+        cookies = self._driver_cookies(driver)
+        return asyncio.run(self._fetch_descriptions_http(urls, cookies))
+
+    def _fill_description(self, driver, urls: list, descriptions: list, i: int, renew: bool):
+        """
+        Load the HTTP miss descriptions[i] in the browser instead. With *renew*
+        (the first miss on a page) that visit has renewed the browser's cookies,
+        so the later misses are retried over HTTP with them first; anything
+        still missing goes to the browser when its job is reached.
+        Empty string means no description was found.
+        """
+        descriptions[i] = self._fetch_full_description(driver, urls[i])
+        if not renew:
+            return
+        rest = [j for j in range(i + 1, len(urls)) if descriptions[j] is None]
+        if rest:
+            cookies = self._driver_cookies(driver)
+            retried = asyncio.run(self._fetch_descriptions_http([urls[j] for j in rest], cookies))
+            for j, desc in zip(rest, retried):
+                descriptions[j] = desc
+
+    def _driver_cookies(self, driver) -> dict:
+        """The browser's cookies as a name -> value dict ({} if they cannot be read)."""
+        try:
+            return {c['name']: c['value'] for c in driver.get_cookies()}
+        except Exception as e:
+            logger.debug(f"  Could not read browser cookies: {e}")
+            return {}
+
+    async def _fetch_descriptions_http(self, urls: list, cookies: dict) -> list:
+        semaphore = asyncio.Semaphore(self.config.detail_concurrency)
+        async with aiohttp.ClientSession(
+            headers={'User-Agent': USER_AGENT},
+            cookies=cookies,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+        ) as session:
+            return await asyncio.gather(
+                *(self._fetch_description_http(session, semaphore, url) for url in urls)
+            )
+
+    async def _fetch_description_http(self, session, semaphore, url: str) -> str | None:
+        """None on any failure, so one bad page only sends that job to the browser path."""
+        async with semaphore:
+            try:
+                async with session.get(url) as resp:
+                    if resp.status != 200:
+                        logger.debug(f"  HTTP {resp.status} for {url}")
+                        return None
+                    html = await resp.text()
+            except Exception as e:   # network, timeout, undecodable body, unknown charset …
+                logger.debug(f"  HTTP fetch failed for {url}: {e}")
+                return None
+        try:
+            return _extract_description(html)
+        except Exception as e:
+            logger.debug(f"  Could not parse {url}: {e}")
+            return None
+
     # ------------------------------------------------------------------
     # Fetch full job description by opening the job page
     # ------------------------------------------------------------------
 
-    def _fetch_full_description(self, url: str) -> str:
+    def _detail_tab(self, driver) -> tuple[str, str]:
         """
-        Open the job detail page in a new tab and extract the full description.
-        Closes the tab and returns to the search results tab.
+        Return (search results handle, job detail handle) for *driver*,
+        opening its job detail tab on first use. The tab is then reused
+        for every job instead of opening and closing one each time.
+        """
+        tabs = self._detail_tabs.get(driver)
+        if tabs is None:
+            search_handle = driver.current_window_handle
+            driver.switch_to.new_window('tab')
+            try:
+                self._block_resources(driver)
+            except WebDriverException as e:   # the tab still works, just unblocked
+                logger.debug(f"  Could not block resources in the detail tab: {e}")
+            tabs = (search_handle, driver.current_window_handle)
+            driver.switch_to.window(search_handle)
+            # Each driver is only used by one worker thread at a time
+            self._detail_tabs[driver] = tabs
+        return tabs
+
+    def _fetch_full_description(self, driver, url: str) -> str:
+        """
+        Load the job detail page in the driver's detail tab and extract the
+        full description, then switch back to the search results tab.
         Returns empty string on failure (fallback — job is still kept).
         """
         if not url or not url.startswith('http'):
             return ""
 
+        full_text = ""
+        search_handle = None
         try:
-            self.driver.execute_script(f"window.open('{url}', '_blank');")
-            self.driver.switch_to.window(self.driver.window_handles[-1])
+            search_handle, detail_handle = self._detail_tab(driver)
+            driver.switch_to.window(detail_handle)
+            driver.get(url)
 
-            rand_delay(CONFIG['delay_open_job'])
+            rand_delay(self.config.delay_open_job)
 
             # Try to wait for the description element
-            full_text = ""
-            for attempt in range(1, CONFIG['max_retries'] + 1):
+            for attempt in range(1, self.config.max_retries + 1):
                 try:
-                    desc_el = WebDriverWait(self.driver, CONFIG['timeout']).until(
+                    desc_el = WebDriverWait(driver, self.config.timeout).until(
                         EC.presence_of_element_located((By.ID, "jobDescriptionText"))
                     )
                     full_text = desc_el.text.strip()
                     break
                 except TimeoutException:
                     logger.warning(f"  Description timeout (attempt {attempt}) for {url}")
-                    if attempt < CONFIG['max_retries']:
+                    if attempt < self.config.max_retries:
                         time.sleep(2 * attempt)
 
+        except NoSuchWindowException as e:
+            # Detail tab went away — open a fresh one next time
+            self._detail_tabs.pop(driver, None)
+            logger.warning(f"  Could not open job page {url}: {e}")
         except Exception as e:
             logger.warning(f"  Could not open job page {url}: {e}")
         finally:
-            # Always close the tab and return to search results
-            try:
-                if len(self.driver.window_handles) > 1:
-                    self.driver.close()
-                    self.driver.switch_to.window(self.driver.window_handles[0])
-            except Exception:
-                pass
+            # Always return to search results
+            if search_handle is not None:
+                try:
+                    driver.switch_to.window(search_handle)
+                except Exception:
+                    pass
 
         return full_text
 
@@ -390,128 +769,245 @@ class IndeedScraper:
     # Scrape one search query (with pagination)
     # ------------------------------------------------------------------
 
-    def _scrape_query(self, query: str):
+    def _scrape_query(self, query: str, driver, kept: list, rejected: list) -> tuple[list, list]:
+        """
+        Scrape one query with *driver*, appending jobs to *kept* and *rejected*
+        as they are found so a caller holding the lists sees partial results
+        if the query is cut short. Returns (kept, rejected).
+        """
+
         logger.info(f"\n{'='*60}")
         logger.info(f"  SEARCH: {query}")
         logger.info(f"{'='*60}")
 
         start = 0
         collected = 0
-        max_collect = CONFIG['results_per_keyword']
-
-        while collected < max_collect:
-            url = self._build_url(query, start)
-            logger.info(f"  Page URL: {url}")
-
-            ok = self._load_page(url, wait_selector='#mosaic-provider-jobcards, .jobsearch-ResultsList')
-            if not ok:
-                logger.error(f"  Skipping query '{query}' — page failed to load after retries.")
-                break
+        skipped_fetches = 0
+        max_collect = self.config.results_per_keyword
+        # Only relevant when descriptions are fetched at all
+        prefilter = (self.config.snippet_prefilter and self.config.require_amazon
+                     and self.config.save_full_description)
 
-            rand_delay(CONFIG['delay_between_pages'])
-
-            soup = BeautifulSoup(self.driver.page_source, 'lxml')
+        try:
+            while collected < max_collect:
+                url = self._build_url(query, start)
+                logger.info(f"  Page URL: {url}")
 
-            # Find job cards — try multiple selectors for resilience
-            cards = soup.find_all('div', class_='job_seen_beacon')
-            if not cards:
-                cards = soup.find_all('td', class_='resultContent')
-            if not cards:
-                logger.warning("  No job cards found on this page — may be blocked or end of results.")
-                break
+                ok = self._load_page(driver, url, wait_selector='#mosaic-provider-jobcards, .jobsearch-ResultsList')
+                if not ok:
+                    logger.error(f"  Skipping query '{query}' — page failed to load after retries.")
+                    break
 
-            logger.info(f"  Found {len(cards)} cards on page (start={start})")
+                rand_delay(self.config.delay_between_pages)
 
-            for card in cards:
-                if collected >= max_collect:
+                cards = _page_card_fields(driver)
+                if not cards:
+                    logger.warning("  No job cards found on this page — may be blocked or end of results.")
                     break
 
-                job = self._parse_card(card)
-                if not job:
-                    continue
+                logger.info(f"  Found {len(cards)} cards on page (start={start})")
 
-                # ── Early company blacklist check BEFORE fetching description ──
+                # ── Parse cards; early company blacklist check BEFORE fetching ──
                 # This saves time by not opening blacklisted company pages at all
-                if any(blocked in job.get('company', '').lower() for blocked in BLACKLISTED_COMPANIES):
-                    logger.debug(f"  BLACKLISTED (skipped fetch): {job['company']}")
-                    self.rejected.append(job)
-                    continue
-
-                # Fetch full description
-                if CONFIG.get('save_full_description', True):
-                    full_desc = self._fetch_full_description(job['url'])
-                    if full_desc:
-                        job['description'] = full_desc
-
-                # ---- Relevance filter (includes company check) ----
-                if not self._is_relevant(job['title'], job['description'], job.get('company', '')):
-                    logger.debug(f"  REJECTED: {job['title']} @ {job.get('company', '')}")
+                candidates = []
+                for card in cards:
+                    job = self._parse_card(card)
+                    if not job:
+                        continue
+
+                    if BLACKLIST_RE.search(job.get('company', '').lower()):
+                        logger.debug(f"  BLACKLISTED (skipped fetch): {job['company']}")
+                        rejected.append(job)
+                        continue
+
+                    # No Amazon term in title + snippet — reject without opening the job
+                    if prefilter and self._index_job(job['title'], job['description']).hits.isdisjoint(self._amazon_terms_lc):
+                        logger.debug(f"  REJECTED on snippet (skipped fetch): {job['title']} @ {job['company']}")
+                        job['search_query'] = query
+                        rejected.append(job)
+                        skipped_fetches += 1
+                        continue
+
+                    candidates.append(job)
+
+                # Fetch full descriptions for the whole page at once over HTTP;
+                # the browser fallback only runs for jobs reached below
+                descriptions = None
+                if candidates and self.config.save_full_description:
+                    urls = [job['url'] for job in candidates]
+                    descriptions = self._fetch_descriptions(driver, urls)
+                cookies_renewed = False
+
+                for i, job in enumerate(candidates):
+                    if collected >= max_collect:
+                        # Leave the rest for later queries, as if never seen
+                        with self._lock:
+                            self.seen_urls.difference_update(j['url'] for j in candidates[i:])
+                        break
+
+                    if descriptions is not None:
+                        if descriptions[i] is None:
+                            self._fill_description(driver, urls, descriptions, i, renew=not cookies_renewed)
+                            cookies_renewed = True
+                        if descriptions[i]:
+                            job['description'] = descriptions[i]
+
+                    # One scan for every keyword; all checks below reuse it
+                    index = self._index_job(job['title'], job['description'])
+
+                    # ---- Relevance filter (includes company check) ----
+                    if not self._is_relevant(index, job.get('company', '')):
+                        logger.debug(f"  REJECTED: {job['title']} @ {job.get('company', '')}")
+                        job['search_query'] = query
+                        rejected.append(job)
+                        continue
+
+                    # ---- Categorise & tag ----
+                    job['category'] = self._categorize(index)
+                    job['keyword']  = self._matched_keywords(index)
                     job['search_query'] = query
-                    self.rejected.append(job)
-                    continue
 
-                # ---- Categorise & tag ----
-                job['category'] = self._categorize(job['title'], job['description'])
-                job['keyword']  = self._matched_keywords(job['title'], job['description'])
-                job['search_query'] = query
+                    kept.append(job)
+                    collected += 1
+                    logger.info(f"  ✅ KEPT [{collected}]: {job['title']} @ {job['company']} — {job['category']}")
 
-                self.jobs.append(job)
-                collected += 1
-                logger.info(f"  ✅ KEPT [{collected}]: {job['title']} @ {job['company']} — {job['category']}")
+                # Pagination
+                try:
+                    driver.find_element(By.CSS_SELECTOR, '[data-testid="pagination-page-next"]')
+                except Exception:
+                    logger.info("  No next page — end of results for this query.")
+                    break
 
-            # Pagination
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, '[data-testid="pagination-page-next"]')
-            except Exception:
-                logger.info("  No next page — end of results for this query.")
-                break
+                start += 10
+                rand_delay(self.config.delay_between_requests)
 
-            start += 10
-            rand_delay(CONFIG['delay_between_requests'])
+        except Exception as e:
+            # Keep the pages already collected rather than losing the whole query
+            logger.error(f"  Query '{query}' stopped early: {e}", exc_info=True)
 
-        logger.info(f"  Query done. Kept {collected} jobs (rejected {len(self.rejected)} so far total).")
+        logger.info(f"  Query done. Kept {collected} jobs, rejected {len(rejected)} for '{query}'.")
+        if prefilter:
+            logger.info(f"  Skipped {skipped_fetches} description fetches on snippet alone.")
+        return kept, rejected
+
+    def _scrape_query_pooled(self, query: str, idle_drivers: queue.SimpleQueue,
+                             kept: list, rejected: list) -> tuple[list, list]:
+        """
+        Run _scrape_query on an idle driver, starting a new one if none is free.
+        A failed query or browser start is logged and returns what was collected
+        so far, so the other queries still finish.
+        """
+        try:
+            driver = idle_drivers.get_nowait()
+        except queue.Empty:
+            try:
+                driver = self._setup_driver()
+            except Exception as e:
+                logger.error(f"Could not start a browser for '{query}': {e}", exc_info=True)
+                return kept, rejected
+        try:
+            self._scrape_query(query, driver, kept, rejected)
+            rand_delay(self.config.delay_between_requests)
+        except Exception as e:
+            logger.error(f"Query '{query}' failed: {e}", exc_info=True)
+        finally:
+            idle_drivers.put(driver)
+        return kept, rejected
 
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
 
-    def run(self):
-        self._setup_driver()
-
-        broad_searches = _runtime.get('keywords') or self.kw_data.get('broad_searches', [])
-        logger.info(f"\n🚀 Starting scraper — {len(broad_searches)} broad search queries")
-        logger.info(f"   require_amazon={CONFIG['require_amazon']}  require_marketplace={CONFIG['require_marketplace']}")
-        logger.info(f"   results_per_query={CONFIG['results_per_keyword']}  headless={CONFIG['headless']}\n")
-
+    def _merge_query(self, result: tuple[list, list], writers: tuple | None):
+        """Add one query's (kept, rejected) jobs to the run, appending them to *writers* if given."""
+        kept, rejected = result
+        kept = [j for j in kept if j.get('title') and j['title'] != 'N/A']
+        self.jobs.extend(kept)
+        self.rejected.extend(rejected)
+        if writers:
+            jobs_writer, rejected_writer = writers
+            jobs_writer.write(kept)
+            rejected_writer.write(rejected)
+
+    def run(self, save: bool = True) -> list[dict]:
+        """
+        Scrape every broad search query and return the kept jobs.
+        With *save* each query's results are appended to CSV/NDJSON files
+        as soon as it finishes.
+        """
+        # Start the first browser up front so a broken Chrome setup raises here
+        idle_drivers = queue.SimpleQueue()
+        idle_drivers.put(self._setup_driver())
+
+        broad_searches = self.config.keywords or self.kw_data.get('broad_searches', [])
+        workers = max(1, min(self.config.parallel_queries, len(broad_searches)))
+        logger.info(f"\n🚀 Starting scraper — {len(broad_searches)} broad search queries on {workers} browser(s)")
+        logger.info(f"   require_amazon={self.config.require_amazon}  require_marketplace={self.config.require_marketplace}")
+        logger.info(f"   results_per_query={self.config.results_per_keyword}  headless={self.config.headless}\n")
+
+        # One timestamp so the output files of a run match
+        ts = time.strftime("%Y-%m-%d_%H-%M-%S")
+        prefix = self.config.output_file_prefix
+        writers = None
+        if save:
+            writers = (JobFileWriter(f"{prefix}_{ts}.csv", f"{prefix}_{ts}.jsonl"),
+                       JobFileWriter(f"rejected_{prefix}_{ts}.csv"))
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        # Each query fills its own (kept, rejected) lists as it goes
+        partial = [([], []) for _ in broad_searches]
+        futures = [pool.submit(self._scrape_query_pooled, query, idle_drivers, *lists)
+                   for query, lists in zip(broad_searches, partial)]
+        merged = 0
+        interrupted = False
         try:
-            for query in broad_searches:
-                self._scrape_query(query)
-                rand_delay(CONFIG['delay_between_requests'])
+            # Merge (and save) queries in query order as they finish
+            for future in futures:
+                self._merge_query(future.result(), writers)
+                merged += 1
 
         except KeyboardInterrupt:
+            interrupted = True
             logger.info("\n⚠️  Interrupted by user — saving collected jobs …")
         except Exception as e:
             logger.error(f"Unexpected error: {e}", exc_info=True)
         finally:
-            if self.driver:
-                self.driver.quit()
+            # Let running queries finish before their browsers are quit,
+            # unless the user asked to stop now
+            pool.shutdown(wait=not interrupted, cancel_futures=True)
+            for driver in self.drivers:
+                try:
+                    driver.quit()
+                except Exception as e:   # a dead session must not stop the rest
+                    logger.debug(f"Could not quit a browser: {e}")
+
+            # Merge whatever the other queries collected, still in query order
+            for kept, rejected in partial[merged:]:
+                self._merge_query((list(kept), list(rejected)), writers)
+
+            if writers:
+                for writer in writers:
+                    writer.close()
 
-            valid = [j for j in self.jobs if j.get('title') and j['title'] != 'N/A']
-            logger.info(f"\n✨ Scraping complete — {len(valid)} jobs kept, {len(self.rejected)} rejected.")
+            logger.info(f"\n✨ Scraping complete — {len(self.jobs)} jobs kept, {len(self.rejected)} rejected.")
 
-            if valid:
-                save_to_csv(valid)
-                save_to_json(valid)
-                generate_summary(valid)
-            else:
+            if not self.jobs:
                 logger.warning("No jobs passed the filter. Try setting require_amazon=False or require_marketplace=False in config.py.")
+            elif save:
+                generate_summary(self.jobs)
+
+            if save and self.rejected:
+                logger.info(f"Rejected jobs saved to {writers[1].csv_filename}")
+
+        return self.jobs
+
 
-            # Optionally save rejected jobs for inspection
-            if self.rejected:
-                ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-                rej_file = f"rejected_indeed_jobs_{ts}.csv"
-                save_to_csv(self.rejected, filename=rej_file)
-                logger.info(f"Rejected jobs saved to {rej_file}")
+def run(config: dict | None = None) -> list[dict]:
+    """
+    Run one scrape in-process with *config* overriding config.py and
+    return the kept jobs in memory (nothing is written to disk).
+    """
+    return IndeedScraper(config).run(save=False)
 
 
 # ---------------------------------------------------------------------------
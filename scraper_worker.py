@@ -0,0 +1,41 @@
+"""
+Long-lived scraper worker used by api.py.
+
+Reads one JSON runtime config per line on stdin, runs the scraper with it
+and answers with one JSON document on the socket inherited as RESULT_FD,
+framed with a 4-byte big-endian length prefix:
+    {"jobs": [...]}        on success, already in the frontend format
+    {"error": "..."}       if the scrape raised
+Keeping this process alive across requests means Python, Selenium and the
+rest of the scraper are only imported once.
+"""
+
+import os
+import socket
+import struct
+import sys
+
+import orjson
+
+import scraper
+from save_results import to_frontend
+
+
+def main():
+    results = socket.socket(fileno=int(os.environ["RESULT_FD"]))
+
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            jobs = scraper.run(orjson.loads(line))
+            # Only ship what the API returns — full descriptions stay in here
+            reply = {"jobs": [to_frontend(j) for j in jobs]}
+        except Exception as e:
+            reply = {"error": str(e)}
+        payload = orjson.dumps(reply)
+        results.sendall(struct.pack(">I", len(payload)) + payload)
+
+
+if __name__ == "__main__":
+    main()
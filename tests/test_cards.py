@@ -0,0 +1,34 @@
+"""
+Reading job card fields from a search results page.
+"""
+
+import scraper
+
+
+class _MosaicDriver:
+    def __init__(self, results):
+        self.results = results
+
+    def execute_script(self, script):
+        assert script == scraper.MOSAIC_RESULTS_JS
+        return self.results
+
+
+def test_bad_mosaic_result_is_skipped():
+    good = {
+        "jobkey": "abc123",
+        "title": "Amazon Account Manager",
+        "company": "Acme",
+        "formattedLocation": "Remote",
+        "salarySnippet": {"text": "$60,000 a year"},
+        "snippet": "<ul><li>Run our <b>Amazon</b> store</li></ul>",
+        "formattedRelativeTime": "2 days ago",
+    }
+    bad = {"jobkey": "def456", "title": "Broken", "salarySnippet": "$50,000"}
+
+    cards = scraper._page_card_fields(_MosaicDriver([None, bad, good]))
+
+    assert len(cards) == 1
+    assert cards[0]["title"] == "Amazon Account Manager"
+    assert cards[0]["salary"] == "$60,000 a year"
+    assert cards[0]["href"] == "/viewjob?jk=abc123"
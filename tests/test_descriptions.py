@@ -0,0 +1,73 @@
+"""
+Description extraction and keyword matching across inline markup.
+"""
+
+import asyncio
+
+import pytest
+
+import scraper
+
+
+@pytest.fixture(params=["selectolax", "lxml"])
+def parser(request, monkeypatch):
+    if request.param == "lxml":
+        monkeypatch.setattr(scraper, "LexborHTMLParser", None)
+    elif scraper.LexborHTMLParser is None:
+        pytest.skip("selectolax not installed")
+
+
+def test_inline_markup_stays_on_one_line(parser):
+    html = ('<div id="jobDescriptionText"><p>Manage <b>Amazon</b> Seller Central and '
+            '<a>FBA</a> inventory.</p><ul><li>PPC</li><li>Listings</li></ul></div>')
+    assert scraper._extract_description(html) == (
+        "Manage Amazon Seller Central and FBA inventory.\nPPC\nListings"
+    )
+
+
+def test_missing_description_is_none(parser):
+    assert scraper._extract_description("<html><body>Just a moment…</body></html>") is None
+
+
+def test_keyword_across_inline_tag_is_matched(parser):
+    job_scraper = scraper.IndeedScraper()
+    job_scraper.kw_data = {
+        "relevance_filters": {"amazon_terms": ["amazon"], "marketplace_terms": ["seller"]},
+        "category_rules": {"Amazon-Specific": {"description_keywords": ["Amazon seller"]}},
+    }
+    job_scraper._compile_keywords()
+
+    description = scraper._extract_description(
+        '<div id="jobDescriptionText"><p>Grow our <b>Amazon</b> seller account</p></div>'
+    )
+    index = job_scraper._index_job("Ecommerce Manager", description)
+    assert "amazon seller" in index.hits
+
+
+class _UndecodableResponse:
+    status = 200
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def text(self):
+        raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+
+class _UndecodableSession:
+    def get(self, url):
+        return _UndecodableResponse()
+
+
+def test_undecodable_detail_page_falls_back():
+    job_scraper = scraper.IndeedScraper()
+
+    async def fetch():
+        return await job_scraper._fetch_description_http(
+            _UndecodableSession(), asyncio.Semaphore(1), "https://www.indeed.com/viewjob?jk=1"
+        )
+
+    assert asyncio.run(fetch()) is None
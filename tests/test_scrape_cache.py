@@ -0,0 +1,85 @@
+"""
+/scrape result cache and in-flight dedupe of identical requests.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import api
+
+
+class _ControlledScrape:
+    """Stands in for api._run_scrape; each run waits until the test resolves it."""
+
+    def __init__(self):
+        self.runs: list[asyncio.Future] = []
+
+    async def __call__(self, runtime_config: dict) -> dict:
+        run = asyncio.get_running_loop().create_future()
+        self.runs.append(run)
+        return await run
+
+
+@pytest.fixture
+def run_scrape(monkeypatch):
+    stub = _ControlledScrape()
+    monkeypatch.setattr(api, "_run_scrape", stub)
+    monkeypatch.setattr(api, "_result_cache", api.TTLCache(maxsize=64, ttl=api.RESULT_CACHE_TTL))
+    monkeypatch.setattr(api, "_inflight", {})
+    return stub
+
+
+def _request() -> api.ScrapeRequest:
+    return api.ScrapeRequest(keywords=["Amazon marketplace"])
+
+
+def test_identical_concurrent_requests_share_one_run(run_scrape):
+    async def scenario():
+        first = asyncio.create_task(api.scrape(_request()))
+        second = asyncio.create_task(api.scrape(_request()))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(run_scrape.runs) == 1
+
+        result = {"jobs": [{"title": "Amazon Account Manager"}], "total": 1}
+        run_scrape.runs[0].set_result(result)
+        assert await first is result
+        assert await second is result
+
+        # Cached now: a repeat doesn't start another run
+        assert await api.scrape(_request()) is result
+        assert len(run_scrape.runs) == 1
+        assert not api._inflight
+
+    asyncio.run(scenario())
+
+
+def test_failure_reaches_every_caller_and_is_not_cached(run_scrape):
+    async def scenario():
+        first = asyncio.create_task(api.scrape(_request()))
+        second = asyncio.create_task(api.scrape(_request()))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(run_scrape.runs) == 1
+
+        run_scrape.runs[0].set_exception(HTTPException(status_code=500, detail="Scraper error: boom"))
+        for caller in (first, second):
+            with pytest.raises(HTTPException) as exc:
+                await caller
+            assert exc.value.status_code == 500
+        assert not api._result_cache
+        assert not api._inflight
+
+        # The next identical request starts a fresh run
+        retry = asyncio.create_task(api.scrape(_request()))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(run_scrape.runs) == 2
+
+        result = {"jobs": [], "total": 0}
+        run_scrape.runs[1].set_result(result)
+        assert await retry is result
+
+    asyncio.run(scenario())